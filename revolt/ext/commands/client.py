@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import re
 import sys
 import traceback
+from functools import lru_cache
 from importlib import import_module
 from typing import (TYPE_CHECKING, Any, Coroutine, Optional, Protocol, TypeVar, Union,
                     overload, runtime_checkable)
@@ -29,6 +31,10 @@ __all__ = (
 V = TypeVar("V")
 T = TypeVar("T")
 
+@lru_cache(maxsize=256)
+def _prefix_regex(prefixes: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, prefixes)))
+
 @runtime_checkable
 class ExtensionProtocol(Protocol):
     @staticmethod
@@ -99,6 +105,8 @@ class CommandsClient(revolt.Client, metaclass=CommandsMeta):
         Sets the custom help command, or remove it if passed ``None``
     case_insensitive: :class:`bool`
         Whether or not commands should be case insensitive
+    prefix: Optional[Union[:class:`str`, list[:class:`str`]]]
+        A fixed prefix(s) for the commands, when set :meth:`get_prefix` is not called for every message
     """
 
     _commands: list[Command[Self]]
@@ -112,13 +120,18 @@ class CommandsClient(revolt.Client, metaclass=CommandsMeta):
         max_messages: int = 5000,
         bot: bool = True,
         help_command: Union[HelpCommand[Self], None, revolt.utils._Missing] = revolt.utils.Missing,
-        case_insensitive: bool = False
+        case_insensitive: bool = False,
+        prefix: Union[str, list[str], None] = None
     ):
         from .help import DefaultHelpCommand, HelpCommandImpl
 
         self.all_commands: dict[str, Command[Self]] | CaseInsensitiveDict[Command[Self]] = {} if not case_insensitive else CaseInsensitiveDict()
         self.cogs: dict[str, Cog[Self]] = {}
         self.extensions: dict[str, ExtensionProtocol] = {}
+        self._commands_version: int = 0
+        self._commands_cache: Optional[list[Command[Self]]] = None
+        self._commands_cache_version: int = -1
+        self._static_prefixes: Optional[tuple[str, ...]] = None if prefix is None else (prefix,) if isinstance(prefix, str) else tuple(prefix)
 
         for command in self._commands:
             self.all_commands[command.name] = command
@@ -143,9 +156,13 @@ class CommandsClient(revolt.Client, metaclass=CommandsMeta):
         Returns
         --------
         list[:class:`Command`]
-            The registered commands
+            The registered commands, a new list is returned each time so it is safe to modify
         """
-        return list(set(self.all_commands.values()))
+        if self._commands_cache is None or self._commands_cache_version != self._commands_version:
+            self._commands_cache = list(dict.fromkeys(self.all_commands.values()))
+            self._commands_cache_version = self._commands_version
+
+        return list(self._commands_cache)
 
     async def get_prefix(self, message: revolt.Message) -> Union[str, list[str]]:
         """Overwrite this function to set the prefix used for commands, this function is called for every message.
@@ -160,6 +177,9 @@ class CommandsClient(revolt.Client, metaclass=CommandsMeta):
         Union[:class:`str`, list[:class:`str`]]
             The prefix(s) for the commands
         """
+        if self._static_prefixes is not None:
+            return list(self._static_prefixes)
+
         raise NotImplementedError
 
     def get_command(self, name: str) -> Command[Self]:
@@ -192,6 +212,8 @@ class CommandsClient(revolt.Client, metaclass=CommandsMeta):
         for alias in command.aliases:
             self.all_commands[alias] = command
 
+        self._commands_version += 1
+
     def remove_command(self, name: str) -> Optional[Command[Self]]:
         """Removes a command.
 
@@ -211,6 +233,8 @@ class CommandsClient(revolt.Client, metaclass=CommandsMeta):
             for alias in command.aliases:
                 self.all_commands.pop(alias, None)
 
+            self._commands_version += 1
+
         return command
 
     def get_view(self, message: revolt.Message) -> type[StringView]:
@@ -248,18 +272,19 @@ class CommandsClient(revolt.Client, metaclass=CommandsMeta):
         """
         content = message.content
 
-        prefixes = await self.get_prefix(message)
+        if (prefixes := self._static_prefixes) is None:
+            dynamic_prefixes = await self.get_prefix(message)
 
-        if isinstance(prefixes, str):
-            prefixes = [prefixes]
+            if isinstance(dynamic_prefixes, str):
+                prefixes = (dynamic_prefixes,)
+            else:
+                prefixes = tuple(dynamic_prefixes)
 
-        for prefix in prefixes:
-            if content.startswith(prefix):
-                content = content[len(prefix):]
-                break
-        else:
+        if not prefixes or not content.startswith(prefixes) or not (match := _prefix_regex(prefixes).match(content)):
             return
 
+        content = content[match.end():]
+
         if not content:
             return
 
@@ -272,9 +297,9 @@ class CommandsClient(revolt.Client, metaclass=CommandsMeta):
 
         context_cls = self.get_context(message)
 
-        try:
-            command = self.get_command(command_name)
-        except KeyError:
+        command = self.all_commands.get(command_name)
+
+        if command is None:
             context = context_cls(None, command_name, view, message, self)
             return self.dispatch("command_error", context, CommandNotFound(command_name))
 
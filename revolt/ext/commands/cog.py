@@ -83,6 +83,8 @@ class Cog(Generic[ClientT_D], metaclass=CogMeta):
                 except KeyError:
                     pass
 
+        client._commands_version += 1
+
         for key, listeners in self._cog_listeners.items():
             for listener_name in listeners:
                 try:
@@ -35,6 +35,8 @@ __all__: tuple[str, ...] = (
 NoneType: type[None] = type(None)
 P = ParamSpec("P")
 
+_NO_DESCRIPTION: str = "No description"
+
 class Command(Generic[ClientT_Co_D]):
     """Class for holding info about a command.
 
@@ -61,7 +63,7 @@ class Command(Generic[ClientT_Co_D]):
     hidden: :class:`bool`
         Whether or not the command should be hidden from the help command
     """
-    __slots__ = ("callback", "name", "aliases", "signature", "checks", "parent", "_error_handler", "cog", "description", "usage", "parameters", "hidden", "cooldown", "cooldown_bucket")
+    __slots__ = ("callback", "name", "aliases", "signature", "checks", "parent", "_error_handler", "cog", "_description", "usage", "parameters", "hidden", "cooldown", "cooldown_bucket", "_help_line", "_usage", "_display_short_description")
 
     def __init__(
             self,
@@ -88,7 +90,9 @@ class Command(Generic[ClientT_Co_D]):
         self.parent: Optional[Group[ClientT_Co_D]] = None
         self.cog: Optional[Cog[ClientT_Co_D]] = None
         self._error_handler: Callable[[Any, Context[ClientT_Co_D], Exception], Coroutine[Any, Any, Any]] = type(self)._default_error_handler
-        self.description: str | None = description or callback.__doc__
+        self._help_line: str | None = None
+        self._usage: str | None = None
+        self.description = description or callback.__doc__
         self.hidden: bool = hidden
 
     async def invoke(self, context: Context[ClientT_Co_D], *args: Any, **kwargs: Any) -> Any:
@@ -240,17 +244,37 @@ class Command(Generic[ClientT_Co_D]):
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} name=\"{self.name}\">"
 
+    @property
+    def description(self) -> Optional[str]:
+        """Optional[:class:`str`] The commands description if it has one"""
+        return self._description
+
+    @description.setter
+    def description(self, value: Optional[str]) -> None:
+        self._description = value
+        self._display_short_description: str = self.short_description or _NO_DESCRIPTION
+        self._help_line = None
+
     @property
     def short_description(self) -> Optional[str]:
         """Returns the first line of the description or None if there is no description."""
         if self.description:
             return self.description.split("\n")[0]
 
+    def _get_help_line(self) -> str:
+        if self._help_line is None:
+            self._help_line = f"  {self.name} - {self._display_short_description}"
+
+        return self._help_line
+
     def get_usage(self) -> str:
         """Returns the usage string for the command."""
         if self.usage:
             return self.usage
 
+        if self._usage is not None:
+            return self._usage
+
         parents: list[str] = []
 
         if self.parent:
@@ -276,7 +300,8 @@ class Command(Generic[ClientT_Co_D]):
             elif parameter.kind == parameter.VAR_POSITIONAL:
                 parameters.append(f"[{parameter.name}...]")
 
-        return f"{' '.join(parents[::-1])} {self.name} {' '.join(parameters)}"
+        self._usage = f"{' '.join(parents[::-1])} {self.name} {' '.join(parameters)}"
+        return self._usage
 
 def is_optional(arg: Any) -> bool:
     return get_origin(arg) in UnionTypes and any(arg is NoneType for arg in get_args(arg))
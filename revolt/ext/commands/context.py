@@ -41,7 +41,7 @@ class Context(revolt.Messageable, Generic[ClientT_Co_D]):
     client: :class:`CommandsClient`
         The revolt client
     """
-    __slots__ = ("command", "invoked_with", "args", "message", "channel", "author", "view", "kwargs", "state", "client", "server_id")
+    __slots__ = ("command", "invoked_with", "args", "message", "channel", "author", "view", "kwargs", "state", "client", "server_id", "_can_run_cache")
 
     async def _get_channel_id(self) -> str:
         return self.channel.id
@@ -58,6 +58,7 @@ class Context(revolt.Messageable, Generic[ClientT_Co_D]):
         self.channel: revolt.TextChannel | revolt.GroupDMChannel | revolt.DMChannel | revolt.SavedMessageChannel = message.channel
         self.author: revolt.Member | revolt.User = message.author
         self.state: State = message.state
+        self._can_run_cache: Optional[dict[Command[ClientT_Co_D], bool]] = None
 
     @property
     def server(self) -> revolt.Server:
@@ -85,17 +86,19 @@ class Context(revolt.Messageable, Generic[ClientT_Co_D]):
         """
 
         if command := self.command:
-            if isinstance(command, Group):
+            while isinstance(command, Group):
                 try:
                     subcommand_name = self.view.get_next_word()
                 except StopIteration:
-                    pass
-                else:
-                    if subcommand := command.subcommands.get(subcommand_name):
-                        self.command = command = subcommand
-                        return await self.invoke()
+                    break
 
+                if not (subcommand := command.subcommands.get(subcommand_name)):
                     self.view.undo()
+                    break
+
+                command = subcommand
+
+            self.command = command
 
             await command.run_cooldown(self)
             await command.parse_arguments(self)
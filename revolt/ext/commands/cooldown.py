@@ -87,24 +87,28 @@ class BucketType(Enum):
     member = 4
 
     def resolve(self, context: Context[ClientT_Co_D]) -> str:
+        author_id = context.author.id
+        channel_id = context.channel.id
+        server_id = context.server_id
+
         if self == BucketType.default:
-            return f"{context.author.id}{context.channel.id}"
+            return f"{author_id}{channel_id}"
 
         elif self == BucketType.user:
-            return context.author.id
+            return author_id
 
         elif self == BucketType.server:
-            if id := context.server_id:
-                return id
+            if server_id:
+                return server_id
 
             raise ServerOnly
 
         elif self == BucketType.channel:
-            return context.channel.id
+            return channel_id
 
         else:  # BucketType.member
-            if server_id := context.server_id:
-                return f"{context.author.id}{server_id}"
+            if server_id:
+                return f"{author_id}{server_id}"
 
             raise ServerOnly
 
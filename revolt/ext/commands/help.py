@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, Optional, TypedDict, Union, cast
+from collections import defaultdict
+from typing import (TYPE_CHECKING, Generic, Iterable, Iterator, Optional, Sequence, TypedDict,
+                    Union, cast)
 
 from typing_extensions import NotRequired
 
@@ -27,6 +30,8 @@ class MessagePayload(TypedDict):
     replies: NotRequired[list[MessageReply]]
 
 class HelpCommand(ABC, Generic[ClientT_Co_D]):
+    __slots__ = ()
+
     @abstractmethod
     async def create_global_help(self, context: Context[ClientT_Co_D], commands: dict[Optional[Cog[ClientT_Co_D]], list[Command[ClientT_Co_D]]]) -> Union[str, SendableEmbed, MessagePayload]:
         raise NotImplementedError
@@ -46,28 +51,44 @@ class HelpCommand(ABC, Generic[ClientT_Co_D]):
     async def send_help_command(self, context: Context[ClientT_Co_D], message_payload: MessagePayload) -> Message:
         return await context.send(**message_payload)
 
-    async def filter_commands(self, context: Context[ClientT_Co_D], commands: list[Command[ClientT_Co_D]]) -> list[Command[ClientT_Co_D]]:
-        filtered: list[Command[ClientT_Co_D]] = []
+    async def _runnable_commands(self, context: Context[ClientT_Co_D], commands: Iterable[Command[ClientT_Co_D]]) -> Iterator[Command[ClientT_Co_D]]:
+        visible = [command for command in commands if not command.hidden]
 
-        for command in commands:
-            if command.hidden:
-                continue
+        cache = context._can_run_cache
+
+        if cache is None:
+            cache = context._can_run_cache = {}
+
+        if pending := [command for command in visible if command not in cache]:
+            results = await asyncio.gather(*[context.can_run(command) for command in pending], return_exceptions=True)
 
-            try:
-                if await context.can_run(command):
-                    filtered.append(command)
-            except Exception:
-                pass
+            for command, result in zip(pending, results):
+                cache[command] = result is True
 
-        return filtered
+        return (command for command in visible if cache[command])
+
+    async def _partition_runnable(self, context: Context[ClientT_Co_D], commands: Sequence[Command[ClientT_Co_D]]) -> dict[Optional[Cog[ClientT_Co_D]], list[Command[ClientT_Co_D]]]:
+        cls = type(self)
+
+        if cls.filter_commands is not HelpCommand.filter_commands or cls.group_commands is not HelpCommand.group_commands:
+            return await self.group_commands(context, await self.filter_commands(context, list(commands)))
+
+        return self._group_commands(await self._runnable_commands(context, commands))
+
+    async def filter_commands(self, context: Context[ClientT_Co_D], commands: list[Command[ClientT_Co_D]]) -> list[Command[ClientT_Co_D]]:
+        return list(await self._runnable_commands(context, commands))
 
     async def group_commands(self, context: Context[ClientT_Co_D], commands: list[Command[ClientT_Co_D]]) -> dict[Optional[Cog[ClientT_Co_D]], list[Command[ClientT_Co_D]]]:
-        cogs: dict[Optional[Cog[ClientT_Co_D]], list[Command[ClientT_Co_D]]] = {}
+        return self._group_commands(commands)
+
+    @staticmethod
+    def _group_commands(commands: Iterable[Command[ClientT_Co_D]]) -> dict[Optional[Cog[ClientT_Co_D]], list[Command[ClientT_Co_D]]]:
+        cogs: defaultdict[Optional[Cog[ClientT_Co_D]], list[Command[ClientT_Co_D]]] = defaultdict(list)
 
         for command in commands:
-            cogs.setdefault(command.cog, []).append(command)
+            cogs[command.cog].append(command)
 
-        return cogs
+        return dict(cogs)
 
     async def handle_message(self, context: Context[ClientT_Co_D], message: Message) -> None:
         pass
@@ -80,68 +101,59 @@ class HelpCommand(ABC, Generic[ClientT_Co_D]):
         raise NotImplementedError
 
 class DefaultHelpCommand(HelpCommand[ClientT_Co_D]):
+    __slots__ = ("default_cog_name",)
+
     def __init__(self, default_cog_name: str = "No Cog"):
         self.default_cog_name = default_cog_name
 
     async def create_global_help(self, context: Context[ClientT_Co_D], commands: dict[Optional[Cog[ClientT_Co_D]], list[Command[ClientT_Co_D]]]) -> Union[str, SendableEmbed, MessagePayload]:
-        lines = ["```"]
-
-        for cog, cog_commands in commands.items():
-            cog_lines: list[str] = []
-            cog_lines.append(f"{cog.qualified_name if cog else self.default_cog_name}:")
-
-            for command in cog_commands:
-                cog_lines.append(f"  {command.name} - {command.short_description or 'No description'}")
-
-            lines.append("\n".join(cog_lines))
-
-        lines.append("```")
-        return "\n".join(lines)
+        return self._create_global_help(context, commands)
 
     async def create_cog_help(self, context: Context[ClientT_Co_D], cog: Cog[ClientT_Co_D]) -> Union[str, SendableEmbed, MessagePayload]:
-        lines = ["```"]
+        return self._create_cog_help(context, cog)
 
-        lines.append(f"{cog.qualified_name}:")
-
-        for command in cog.commands:
-            lines.append(f"  {command.name} - {command.short_description or 'No description'}")
+    async def create_command_help(self, context: Context[ClientT_Co_D], command: Command[ClientT_Co_D]) -> Union[str, SendableEmbed, MessagePayload]:
+        return self._create_command_help(context, command)
 
-        lines.append("```")
-        return "\n".join(lines)
+    async def create_group_help(self, context: Context[ClientT_Co_D], group: Group[ClientT_Co_D]) -> Union[str, SendableEmbed, MessagePayload]:
+        return self._create_group_help(context, group)
 
-    async def create_command_help(self, context: Context[ClientT_Co_D], command: Command[ClientT_Co_D]) -> Union[str, SendableEmbed, MessagePayload]:
-        lines = ["```"]
+    def _create_global_help(self, context: Context[ClientT_Co_D], commands: dict[Optional[Cog[ClientT_Co_D]], list[Command[ClientT_Co_D]]]) -> MessagePayload:
+        lines: list[str] = []
 
-        lines.append(f"{command.name}:")
-        lines.append(f"  Usage: {command.get_usage()}")
+        for cog, cog_commands in commands.items():
+            lines.append(f"{cog.qualified_name if cog else self.default_cog_name}:")
+            lines += [command._get_help_line() for command in cog_commands]
 
-        if command.aliases:
-            lines.append(f"  Aliases: {', '.join(command.aliases)}")
+        body = "\n".join(lines)
+        return {"content": f"```\n{body}\n```"}
 
+    def _create_cog_help(self, context: Context[ClientT_Co_D], cog: Cog[ClientT_Co_D]) -> MessagePayload:
+        lines: list[str] = []
 
-        if command.description:
-            lines.append(command.description)
+        lines.append(f"{cog.qualified_name}:")
 
-        lines.append("```")
-        return "\n".join(lines)
+        lines += [command._get_help_line() for command in cog.commands]
 
-    async def create_group_help(self, context: Context[ClientT_Co_D], group: Group[ClientT_Co_D]) -> Union[str, SendableEmbed, MessagePayload]:
-        lines = ["```"]
+        body = "\n".join(lines)
+        return {"content": f"```\n{body}\n```"}
 
-        lines.append(f"{group.name}:")
-        lines.append(f"  Usage: {group.get_usage()}")
+    @staticmethod
+    def _command_header(command: Command[ClientT_Co_D]) -> str:
+        aliases = f"\n  Aliases: {', '.join(command.aliases)}" if command.aliases else ""
+        description = f"\n{command.description}" if command.description else ""
 
-        if group.aliases:
-            lines.append(f"  Aliases: {', '.join(group.aliases)}")
+        return f"{command.name}:\n  Usage: {command.get_usage()}{aliases}{description}"
 
-        if group.description:
-            lines.append(group.description)
+    def _create_command_help(self, context: Context[ClientT_Co_D], command: Command[ClientT_Co_D]) -> MessagePayload:
+        return {"content": f"```\n{self._command_header(command)}\n```"}
 
-        for command in group.commands:
-            lines.append(f"  {command.name} - {command.short_description or 'No description'}")
+    def _create_group_help(self, context: Context[ClientT_Co_D], group: Group[ClientT_Co_D]) -> MessagePayload:
+        lines = [self._command_header(group)]
+        lines += [command._get_help_line() for command in group.commands]
 
-        lines.append("```")
-        return "\n".join(lines)
+        body = "\n".join(lines)
+        return {"content": f"```\n{body}\n```"}
 
     async def handle_no_command_found(self, context: Context[ClientT_Co_D], name: str) -> str:
         return f"Command `{name}` not found."
@@ -150,67 +162,74 @@ class HelpCommandImpl(Command[ClientT_Co_D]):
     def __init__(self, client: ClientT_Co_D):
         self.client = client
 
-        async def callback(_: Union[ClientT_Co_D, Cog[ClientT_Co_D]], context: Context[ClientT_Co_D], *args: str) -> None:
-            await help_command_impl(context.client, context, *args)
+        super().__init__(callback=help_command_impl, name="help", aliases=[])
+        self.description = "Shows help for a command, cog or the entire bot"
 
-        super().__init__(callback=callback, name="help", aliases=[])
-        self.description: str | None = "Shows help for a command, cog or the entire bot"
+
+def _to_payload(payload: Union[str, SendableEmbed, MessagePayload]) -> MessagePayload:
+    if isinstance(payload, dict):
+        return payload
+    elif isinstance(payload, str):
+        return {"content": payload}
+    else:
+        return {"embed": payload, "content": " "}
 
 
-async def help_command_impl(client: ClientT_D, context: Context[ClientT_D], *arguments: str) -> None:
+async def help_command_impl(_: Union[ClientT_D, Cog[ClientT_D]], context: Context[ClientT_D], *args: str) -> None:
+    # the first argument is the cog instead of the client if the help command has been moved into a cog
+    client = context.client
     help_command = client.help_command
 
     if not help_command:
         return
 
-    filtered_commands = await help_command.filter_commands(context, client.commands)
-    commands = await help_command.group_commands(context, filtered_commands)
+    default_help = cast(DefaultHelpCommand[ClientT_D], help_command) if help_command.__class__ is DefaultHelpCommand else None
 
-    if not arguments:
-        payload = await help_command.create_global_help(context, commands)
+    if not args:
+        commands = await help_command._partition_runnable(context, client.commands)
+
+        if default_help is not None:
+            payload = default_help._create_global_help(context, commands)
+        else:
+            payload = await help_command.create_global_help(context, commands)
 
     else:
-        parent: ClientT_D | Group[ClientT_D] = client
-
-        for param in arguments:
-            try:
-                command = parent.get_command(param)
-            except LookupError:
-                try:
-                    cog = client.get_cog(param)
-                except LookupError:
+        subcommands: dict[str, Command[ClientT_D]] = client.all_commands
+
+        for param in args:
+            command = subcommands.get(param)
+
+            if command is None:
+                if not (cog := client.cogs.get(param)):
                     payload = await help_command.handle_no_command_found(context, param)
+                elif default_help is not None:
+                    payload = default_help._create_cog_help(context, cog)
                 else:
                     payload = await help_command.create_cog_help(context, cog)
-                finally:
-                    break
+
+                break
 
             if isinstance(command, Group):
-                parent = command
+                subcommands = command.subcommands
             else:
-                payload = await help_command.create_command_help(context, command)
                 break
-        else:
 
-            if TYPE_CHECKING:
-                command = cast(Command[ClientT_D], ...)
+        if TYPE_CHECKING:
+            command = cast(Optional[Command[ClientT_D]], ...)
 
-            if isinstance(command, Group):
+        if isinstance(command, Group):
+            if default_help is not None:
+                payload = default_help._create_group_help(context, command)
+            else:
                 payload = await help_command.create_group_help(context, command)
+        elif command is not None:
+            if default_help is not None:
+                payload = default_help._create_command_help(context, command)
             else:
                 payload = await help_command.create_command_help(context, command)
 
     if TYPE_CHECKING:
         payload = cast(MessagePayload, ...)
 
-    msg_payload: MessagePayload
-
-    if isinstance(payload, str):
-        msg_payload = {"content": payload}
-    elif isinstance(payload, SendableEmbed):
-        msg_payload = {"embed": payload, "content": " "}
-    else:
-        msg_payload = payload
-
-    message = await help_command.send_help_command(context, msg_payload)
+    message = await help_command.send_help_command(context, _to_payload(payload))
     await help_command.handle_message(context, message)
@@ -18,13 +18,7 @@ ClientT_Co_D = TypeVar("ClientT_Co_D", bound="CommandsClient", default="Commands
 ContextT = TypeVar("ContextT", bound="Context", default="Context")
 
 def evaluate_parameters(parameters: Iterable[Parameter], globals: dict[str, Any]) -> list[Parameter]:
-    new_parameters: list[Parameter] = []
-
-    for parameter in parameters:
-        if parameter.annotation is not parameter.empty:
-            if isinstance(parameter.annotation, str):
-                parameter = parameter.replace(annotation=eval(parameter.annotation, globals))
-
-        new_parameters.append(parameter)
-
-    return new_parameters
+    return [
+        parameter.replace(annotation=eval(parameter.annotation, globals)) if isinstance(parameter.annotation, str) else parameter
+        for parameter in parameters
+    ]
@@ -1,12 +1,19 @@
-from typing import Iterator
+import re
+
 from typing_extensions import Self
 
 from .errors import NoClosingQuote
 
+# skips leading spaces, then matches either a quoted word, an unclosed quote or a bare word along with the character that ended it
+word_regex: re.Pattern[str] = re.compile(r" *(?:([\"'])(.*?)\1|([\"'])|([^ ][^ \n]*)[ \n]?)", re.DOTALL)
+
 
 class StringView:
+    __slots__ = ("value", "position", "temp", "should_undo")
+
     def __init__(self, string: str):
-        self.value: Iterator[str] = iter(string)
+        self.value: str = string
+        self.position: int = 0
         self.temp: str = ""
         self.should_undo: bool = False
 
@@ -14,43 +21,44 @@ class StringView:
         self.should_undo = True
 
     def next_char(self) -> str:
-        return next(self.value)
+        try:
+            char = self.value[self.position]
+        except IndexError:
+            raise StopIteration from None
+
+        self.position += 1
+        return char
 
     def get_rest(self) -> str:
+        rest = self.value[self.position:]
+        self.position = len(self.value)
+
         if self.should_undo:
-            return f"{self.temp} {''.join(self.value)}".rstrip()
+            return f"{self.temp} {rest}".rstrip()
             # prevent a new space appearing at end if the buffer is depleted
 
-        return "".join(self.value)
+        return rest
 
     def get_next_word(self) -> str:
         if self.should_undo:
             self.should_undo = False
             return self.temp
 
-        char = self.next_char()
-        temp: list[str] = []
-
-        while char == " ":
-            char = self.next_char()
-
-        if char in ["\"", "'"]:
-            quote = char
-            try:
-                while (char := self.next_char()) != quote:
-                    temp.append(char)
-            except StopIteration:
-                raise NoClosingQuote
-
-        else:
-            temp.append(char)
-            try:
-                while (char := self.next_char()) not in " \n":
-                    temp.append(char)
-            except StopIteration:
-                pass
-
-        output = "".join(temp)
+        match = word_regex.match(self.value, self.position)
+
+        if match is None:
+            self.position = len(self.value)
+            raise StopIteration
+
+        quote, quoted, unclosed, word = match.groups()
+
+        if unclosed:
+            self.position = len(self.value)
+            raise NoClosingQuote
+
+        self.position = match.end()
+
+        output = quoted if quote else word
         self.temp = output
 
         return output
@@ -59,4 +67,4 @@ class StringView:
         return self
 
     def __next__(self) -> str:
-        return self.get_next_word()
\ No newline at end of file
+        return self.get_next_word()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import io
-from typing import Optional, Union, cast
+from typing import Optional, Union
 
 __all__ = ("File",)
 
@@ -17,22 +17,30 @@ class File:
     spoiler: bool
         Determines if the file will be a spoiler, this prefexes the filename with `SPOILER_`
     """
-    __slots__ = ("f", "spoiler", "filename")
+    __slots__ = ("_source", "_f", "spoiler", "filename")
 
     def __init__(self, file: Union[str, bytes], *, filename: Optional[str] = None, spoiler: bool = False):
-        self.f: io.BufferedIOBase
-
-        if isinstance(file, str):
-            self.f = open(file, "rb")
-        else:
-            self.f = io.BytesIO(file)
+        self._source: Union[str, bytes] = file
+        self._f: Optional[io.BufferedIOBase] = None
 
         if filename is None and isinstance(file, str):
-            filename = cast(Optional[str], self.f.name)
+            filename = file
 
-        self.spoiler: bool = spoiler or (bool(filename) and filename.startswith("SPOILER_"))
+        has_prefix = bool(filename) and filename.startswith("SPOILER_")
+        self.spoiler: bool = spoiler or has_prefix
 
-        if self.spoiler and (filename and not filename.startswith("SPOILER_")):
+        if spoiler and filename and not has_prefix:
             filename = f"SPOILER_{filename}"
 
         self.filename: str | None = filename
+
+    @property
+    def f(self) -> io.BufferedIOBase:
+        """:class:`io.BufferedIOBase` The file object of the contents, files on disk are only opened once this is first accessed"""
+        if self._f is None:
+            if isinstance(self._source, str):
+                self._f = open(self._source, "rb")
+            else:
+                self._f = io.BytesIO(self._source)
+
+        return self._f
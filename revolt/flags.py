@@ -26,16 +26,24 @@ class Flag:
         if instance is None:
             return self
 
-        return instance._check_flag(self.flag)
+        flag = self.flag
+        return (instance.value & flag) == flag
 
     def __set__(self, instance: Flags, value: bool) -> None:
-        instance._set_flag(self.flag, value)
+        if value:
+            instance.value |= self.flag
+        else:
+            instance.value &= ~self.flag
 
 class Flags:
+    __slots__ = ("value",)
+
     FLAG_NAMES: list[str]
+    _flag_pairs: tuple[tuple[str, int], ...]
 
     def __init_subclass__(cls) -> None:
         cls.FLAG_NAMES = []
+        cls._flag_pairs = tuple((name, value.flag) for name, value in cls.__dict__.items() if isinstance(value, Flag))
 
         for name in dir(cls):
             value = getattr(cls, name)
@@ -44,7 +52,7 @@ class Flags:
                 cls.FLAG_NAMES.append(name)
 
     def __init__(self, value: int = 0, **flags: bool):
-        self.value = value
+        self.value: int = value
 
         for k, v in flags.items():
             setattr(self, k, v)
@@ -71,13 +79,22 @@ class Flags:
         return not self.__eq__(other)
 
     def __or__(self, other: Self) -> Self:
-        return self.__class__._from_value(self.value | other.value)
+        cls = self.__class__
+        flags = cls.__new__(cls)
+        flags.value = self.value | other.value
+        return flags
 
     def __and__(self, other: Self) -> Self:
-        return self.__class__._from_value(self.value & other.value)
+        cls = self.__class__
+        flags = cls.__new__(cls)
+        flags.value = self.value & other.value
+        return flags
 
     def __invert__(self) -> Self:
-        return self.__class__._from_value(~self.value)
+        cls = self.__class__
+        flags = cls.__new__(cls)
+        flags.value = ~self.value
+        return flags
 
     def __add__(self, other: Self) -> Self:
         return self | other
@@ -95,15 +112,15 @@ class Flags:
         return f"<{self.__class__.__name__} value={self.value}>"
 
     def __iter__(self) -> Iterator[tuple[str, bool]]:
-        for name, value in self.__class__.__dict__.items():
-            if isinstance(value, Flag):
-                yield name, self._check_flag(value.flag)
+        for name, flag in self._flag_pairs:
+            yield name, (self.value & flag) == flag
 
     def __hash__(self) -> int:
         return hash(self.value)
 
 class UserBadges(Flags):
     """Contains all user badges"""
+    __slots__ = ()
 
     @Flag
     def developer():
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
-from typing import (TYPE_CHECKING, Any, Coroutine, Literal, Optional, TypeVar,
-                    Union, overload)
+import asyncio
+from secrets import token_hex
+from typing import (TYPE_CHECKING, Any, Callable, Coroutine, Literal, Optional,
+                    TypeVar, Union, overload)
 
 import aiohttp
-import ulid
 
 
 from .errors import Forbidden, HTTPError, ServerError
 from .file import File
 
 try:
-    import ujson as _json
+    import orjson
+
+    _json_dumps: Callable[[Any], Union[str, bytes]] = orjson.dumps
+    _json_loads: Callable[[Union[str, bytes]], Any] = orjson.loads
 except ImportError:
-    import json as _json
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+
+    _json_dumps = _json.dumps
+    _json_loads = _json.loads
 
 if TYPE_CHECKING:
     import aiohttp
@@ -31,15 +41,17 @@ if TYPE_CHECKING:
     from .types import (Server, ServerBans, TextChannel, UserProfile, VoiceChannel, Member, Invite, ApiInfo, Channel, SavedMessages,
                         DMChannel, EmojiParent, GetServerMembers, GroupDMChannel, MessageReplyPayload, MessageWithUserData, PartialInvite, CreateRole)
 
-    from aiohttp.client import _RequestOptions
-
 __all__ = ("HttpClient",)
 
 T = TypeVar("T")
 Request = Coroutine[Any, Any, T]
 
+USER_AGENT: str = "Revolt.py (https://github.com/revoltchat/revolt.py)"
+DEFAULT_AVATAR_CACHE_SIZE: int = 256
+MAX_CONCURRENT_UPLOADS: int = 8
+
 class HttpClient:
-    __slots__ = ("session", "token", "api_url", "api_info", "auth_header")
+    __slots__ = ("session", "token", "api_url", "api_info", "auth_header", "_headers", "_json_headers", "_upload_headers", "_default_avatars", "_upload_semaphore")
 
     def __init__(self, session: aiohttp.ClientSession, token: str, api_url: str, api_info: ApiInfo, bot: bool = True):
         self.session: aiohttp.ClientSession = session
@@ -48,60 +60,52 @@ class HttpClient:
         self.api_info: ApiInfo = api_info
         self.auth_header: str = "x-bot-token" if bot else "x-session-token"
 
-    async def request(self, method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"], route: str, *, json: Optional[dict[str, Any]] = None, nonce: bool = True, params: Optional[dict[str, Any]] = None) -> Any:
-        url = f"{self.api_url}{route}"
-
-        kwargs: _RequestOptions = {}
+        self._headers: dict[str, str] = {"User-Agent": USER_AGENT, self.auth_header: token}
+        self._json_headers: dict[str, str] = {**self._headers, "Content-Type": "application/json"}
+        self._upload_headers: dict[str, str] = {"User-Agent": USER_AGENT}
+        self._default_avatars: dict[str, bytes] = {}
+        self._upload_semaphore: asyncio.Semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
 
-        headers = {
-            "User-Agent": "Revolt.py (https://github.com/revoltchat/revolt.py)",
-            self.auth_header: self.token
-        }
+    async def request(self, method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"], route: str, *, json: Optional[dict[str, Any]] = None, nonce: bool = False, params: Optional[dict[str, Any]] = None) -> Any:
+        url = self.api_url + route
 
         if json:
-            headers["Content-Type"] = "application/json"
+            headers = self._json_headers
 
             if nonce:
-                json["nonce"] = ulid.new().str # type: ignore
+                json["nonce"] = token_hex(16)
 
-            kwargs["data"] = _json.dumps(json)
+            data = _json_dumps(json)
+        else:
+            headers = self._headers
+            data = None
 
-        kwargs["headers"] = headers
+        async with self.session.request(method, url, data=data, headers=headers, params=params) as resp:
+            resp_code = resp.status
 
-        if params:
-            kwargs["params"] = params
+            if resp_code == 401:
+                raise Forbidden("401: Missing Permissions")
+            elif resp_code >= 400:
+                raise HTTPError(resp_code)
 
-        async with self.session.request(method, url, **kwargs) as resp:
-            text = await resp.text()
-            if text:
+            body = await resp.read()
+            if body:
                 try:
-                    response = _json.loads(await resp.text())
+                    return _json_loads(body)
                 except ValueError:
-                    raise HTTPError(f"Invalid json response:\n{text}") from None
+                    raise HTTPError(f"Invalid json response:\n{body.decode(errors='replace')}") from None
             else:
-                response = text
-
-        resp_code = resp.status
-
-        if 200 <= resp_code <= 300:
-            return response
-        elif resp_code == 401:
-            raise Forbidden("401: Missing Permissions")
-        else:
-            raise HTTPError(resp_code)
+                return ""
 
     async def upload_file(self, file: File, tag: Literal["attachments", "avatars", "backgrounds", "icons", "banners", "emojis"]) -> AutumnPayload:
         url = f"{self.api_info['features']['autumn']['url']}/{tag}"
 
-        headers = {
-            "User-Agent": "Revolt.py (https://github.com/revoltchat/revolt.py)"
-        }
-
         form = aiohttp.FormData()
-        form.add_field("file", file.f.read(), filename=file.filename)
+        source = file._source
+        form.add_field("file", source if isinstance(source, bytes) else file.f, filename=file.filename, content_type="application/octet-stream")
 
-        async with self.session.post(url, data=form, headers=headers) as resp:
-            response: AutumnPayload = _json.loads(await resp.text())
+        async with self._upload_semaphore, self.session.post(url, data=form, headers=self._upload_headers) as resp:
+            response: AutumnPayload = _json_loads(await resp.read())
 
         resp_code = resp.status
 
@@ -122,13 +126,8 @@ class HttpClient:
             json["embeds"] = embeds
 
         if attachments:
-            attachment_ids: list[str] = []
-
-            for attachment in attachments:
-                data = await self.upload_file(attachment, "attachments")
-                attachment_ids.append(data["id"])
-
-            json["attachments"] = attachment_ids
+            uploaded = await asyncio.gather(*[self.upload_file(attachment, "attachments") for attachment in attachments])
+            json["attachments"] = [data["id"] for data in uploaded]
 
         if replies:
             json["replies"] = replies
@@ -139,7 +138,7 @@ class HttpClient:
         if interactions:
             json["interactions"] = interactions
 
-        return await self.request("POST", f"/channels/{channel}/messages", json=json)
+        return await self.request("POST", f"/channels/{channel}/messages", json=json, nonce=True)
 
     def edit_message(self, channel: str, message: str, content: Optional[str], embeds: Optional[list[SendableEmbedPayload]] = None) -> Request[None]:
         json: dict[str, Any] = {}
@@ -198,7 +197,7 @@ class HttpClient:
         include_users: bool = False
     ) -> Request[Union[list[MessagePayload], MessageWithUserData]]:
 
-        json: dict[str, Any] = {"sort": sort.value, "include_users": str(include_users)}
+        json: dict[str, Any] = {"sort": sort.value, "include_users": "true" if include_users else "false"}
 
         if limit:
             json["limit"] = limit
@@ -280,8 +279,23 @@ class HttpClient:
     def fetch_profile(self, user_id: str) -> Request[UserProfile]:
         return self.request("GET", f"/users/{user_id}/profile")
 
-    def fetch_default_avatar(self, user_id: str) -> Request[bytes]:
-        return self.request_file(f"{self.api_url}/users/{user_id}/default_avatar")
+    async def fetch_default_avatar(self, user_id: str) -> bytes:
+        # reinserted on a hit so the least recently used avatar is evicted first
+        if (avatar := self._default_avatars.pop(user_id, None)) is not None:
+            self._default_avatars[user_id] = avatar
+            return avatar
+
+        async with self.session.get(f"{self.api_url}/users/{user_id}/default_avatar") as resp:
+            avatar = await resp.content.read()
+
+            if resp.status >= 400:
+                return avatar
+
+        if len(self._default_avatars) >= DEFAULT_AVATAR_CACHE_SIZE:
+            del self._default_avatars[next(iter(self._default_avatars))]
+
+        self._default_avatars[user_id] = avatar
+        return avatar
 
     def fetch_dm_channels(self) -> Request[list[Union[DMChannel, GroupDMChannel]]]:
         return self.request("GET", "/users/dms")
@@ -335,7 +349,7 @@ class HttpClient:
     def ban_member(self, server_id: str, member_id: str, reason: Optional[str]) -> Request[GetServerMembers]:
         payload = {"reason": reason} if reason else None
 
-        return self.request("PUT", f"/servers/{server_id}/bans/{member_id}", json=payload, nonce=False)
+        return self.request("PUT", f"/servers/{server_id}/bans/{member_id}", json=payload)
 
     def unban_member(self, server_id: str, member_id: str) -> Request[None]:
         return self.request("DELETE", f"/servers/{server_id}/bans/{member_id}")
@@ -344,7 +358,7 @@ class HttpClient:
         return self.request("GET", f"/servers/{server_id}/bans")
 
     def create_role(self, server_id: str, name: str) -> Request[CreateRole]:
-        return self.request("POST", f"/servers/{server_id}/roles", json={"name": name}, nonce=False)
+        return self.request("POST", f"/servers/{server_id}/roles", json={"name": name})
 
     def delete_role(self, server_id: str, role_id: str) -> Request[None]:
         return self.request("DELETE", f"/servers/{server_id}/roles/{role_id}")
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING, Any, Optional
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 
 from .utils import _Missing, Missing, parse_timestamp
@@ -22,9 +23,16 @@ if TYPE_CHECKING:
 
 __all__ = ("Member",)
 
-def flattern_user(member: Member, user: User) -> None:
-    for attr in user.__flattern_attributes__:
-        setattr(member, attr, getattr(user, attr))
+_role_rank = attrgetter("rank")
+
+def _create_flattern_user() -> Callable[[Member, User], None]:
+    lines = [f"    member.{attr} = user.{attr}" for attr in User.__flattern_attributes__]
+    namespace: dict[str, Any] = {}
+
+    exec("def flattern_user(member, user):\n" + "\n".join(lines), namespace)
+    return namespace["flattern_user"]
+
+flattern_user = _create_flattern_user()
 
 class Member(User):
     """Represents a member of a server, subclasses :class:`User`
@@ -58,8 +66,12 @@ class Member(User):
         else:
             self.guild_avatar = None
 
-        roles = [server.get_role(role_id) for role_id in data.get("roles", [])]
-        self.roles: list[Role] = sorted(roles, key=lambda role: role.rank, reverse=True)
+        get_role = server.get_role
+        roles = [get_role(role_id) for role_id in data.get("roles") or ()]
+        if len(roles) > 1:
+            roles.sort(key=_role_rank, reverse=True)
+
+        self.roles: list[Role] = roles
 
         self.server: Server = server
         self.nickname: str | None = data.get("nickname")
@@ -102,8 +114,12 @@ class Member(User):
             self.guild_avatar = Asset(avatar, self.state)
 
         if roles is not None:
-            member_roles = [self.server.get_role(role_id) for role_id in roles]
-            self.roles = sorted(member_roles, key=lambda role: role.rank, reverse=True)
+            get_role = self.server.get_role
+            member_roles = [get_role(role_id) for role_id in roles]
+            if len(member_roles) > 1:
+                member_roles.sort(key=_role_rank, reverse=True)
+
+            self.roles = member_roles
 
         if timeout is not None:
             self.current_timeout = parse_timestamp(timeout)
@@ -224,7 +240,7 @@ class Member(User):
         """
         calculated_perms = self.get_permissions()
 
-        return all([getattr(calculated_perms, key, False) == value for key, value in permissions.items()])
+        return all(getattr(calculated_perms, key, False) == value for key, value in permissions.items())
 
     def has_channel_permissions(self, channel: Channel, **permissions: bool) -> bool:
         """Computes if the member has the specified permissions, taking into account the channel as well
@@ -243,4 +259,4 @@ class Member(User):
         """
         calculated_perms = self.get_channel_permissions(channel)
 
-        return all([getattr(calculated_perms, key, False) == value for key, value in permissions.items()])
+        return all(getattr(calculated_perms, key, False) == value for key, value in permissions.items())
@@ -11,6 +11,7 @@ __all__ = ("Permissions", "PermissionsOverwrite", "UserPermissions")
 
 class UserPermissions(Flags):
     """Permissions for users"""
+    __slots__ = ()
 
     @Flag
     def access() -> int:
@@ -34,6 +35,7 @@ class UserPermissions(Flags):
 
 class Permissions(Flags):
     """Server permissions for members and roles"""
+    __slots__ = ()
 
     @Flag
     def manage_channel() -> int:
@@ -157,7 +159,7 @@ class Permissions(Flags):
 
     @classmethod
     def default_direct_message(cls) -> Self:
-        return cls.default_view_only() | cls(react=True, manage_channel=True)
+        return cls.default_view_only() | cls(manage_channel=True)
 
 class PermissionsOverwrite:
     """A permissions overwrite in a channel"""
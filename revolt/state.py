@@ -116,8 +116,10 @@ class State:
         for user in data["users"]:
             self.add_user(user)
 
+        server = self.get_server(server_id)
+
         for member in data["members"]:
-            self.add_member(server_id, member)
+            server._add_member(member)
 
     async def fetch_all_server_members(self) -> None:
         for server_id in self.servers:
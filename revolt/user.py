@@ -173,7 +173,7 @@ class User(Messageable, Ulid):
         """
         perms = self.get_permissions()
 
-        return all([getattr(perms, key, False) == value for key, value in permissions.items()])
+        return all(getattr(perms, key, False) == value for key, value in permissions.items())
 
     async def _get_channel_id(self):
         if not self.dm_channel: